@@ -5,9 +5,20 @@ import requests
 import csv
 import urllib.parse
 import io
+import os
 import re
 import socket
 import subprocess
+import time
+import bisect
+import itertools
+import json
+import base64
+import zlib
+import multiprocessing
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from PIL import Image, ImageTk
 from bs4 import BeautifulSoup
 from deep_translator import GoogleTranslator
@@ -24,15 +35,30 @@ def copy_selection(widget):
         pass
 
 def add_copy_context_menu(widget):
+    # One menu per widget, reused for every right-click.
+    menu = tk.Menu(widget, tearoff=0)
+    menu.add_command(label="Copy", command=lambda: copy_selection(widget))
+
     def show_context(event):
-        menu = tk.Menu(widget, tearoff=0)
-        menu.add_command(label="Copy", command=lambda: copy_selection(widget))
         try:
             menu.tk_popup(event.x_root, event.y_root)
         finally:
             menu.grab_release()
     widget.bind("<Button-3>", show_context)
 
+# ---------------- Console Helpers ---------------- #
+CONSOLE_MAX_LINES = 500
+
+def append_console_line(console_text, message, max_lines=CONSOLE_MAX_LINES):
+    console_text.config(state="normal")
+    console_text.insert(tk.END, message + "\n")
+    # Keep the console a ring buffer: once over the cap, drop the oldest lines.
+    line_count = int(console_text.index("end-1c").split(".")[0]) - 1
+    if line_count > max_lines:
+        console_text.delete("1.0", f"{line_count - max_lines + 1}.0")
+    console_text.see(tk.END)
+    console_text.config(state="disabled")
+
 # ---------------- Tor Daemon Helpers ---------------- #
 def is_tor_running(port=9050):
     s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
@@ -52,25 +78,424 @@ def start_tor_daemon():
         print("Failed to start Tor daemon:", e)
         return False
 
+# ---------------- Caches ---------------- #
+class LRUCache:
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self.lock:
+            if key not in self.entries:
+                return default
+            self.entries.move_to_end(key)
+            return self.entries[key]
+
+    def put(self, key, value):
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def items(self, limit=None):
+        # Least recently used first, so re-inserting them in order preserves recency.
+        with self.lock:
+            items = list(self.entries.items())
+        return items[-limit:] if limit else items
+
+SUGGESTION_CACHE = LRUCache(1000)  # query -> suggestions
+SNIPPET_CACHE = LRUCache(300)  # DuckDuckGo URL -> snippets
+TRANSLATION_CACHE = LRUCache(2000)  # (lang_code, text) -> translation
+# (canonical dHash, size) -> thumbnail. Each holds ~100 KB of raw RGB, so keep about what the
+# three tabs' grids (9 + 20 + 20) show at once.
+THUMBNAIL_CACHE = LRUCache(60)
+
 # ---------------- Suggestion Fetcher ---------------- #
 def get_google_suggestions(query):
+    cached = SUGGESTION_CACHE.get(query)
+    if cached is not None:
+        return cached
     url = "https://suggestqueries.google.com/complete/search?client=firefox&q=" + urllib.parse.quote(query)
     try:
         resp = requests.get(url, timeout=5)
         if resp.status_code == 200:
             data = resp.json()
             if len(data) > 1:
+                SUGGESTION_CACHE.put(query, data[1])
                 return data[1]
     except Exception:
         return []
     return []
 
+# ---------------- CPU Offload (Threads or Process Pool) ---------------- #
+# The parse/decode functions below may run inside worker processes, so they stay
+# at module level and only take and return plain picklable data.
+def extract_snippets(html, max_snippets=5):
+    soup = BeautifulSoup(html, "html.parser")
+    snippets = []
+    for result in soup.find_all("div", class_="result"):
+        snippet = result.find("a", class_="result__snippet") or result.find("div", class_="result__snippet")
+        if snippet:
+            text = snippet.get_text().strip()
+            if text and len(text.split()) > 5:
+                snippets.append(text)
+        if len(snippets) >= max_snippets:
+            break
+    return snippets
+
+def extract_image_urls(html, max_images):
+    soup = BeautifulSoup(html, "html.parser")
+    img_urls = []
+    for tag in soup.find_all("img"):
+        src = tag.get("data-src") or tag.get("src")
+        if src and src.startswith("http") and src not in img_urls:
+            img_urls.append(src)
+        if len(img_urls) >= max_images:
+            break
+    return img_urls
+
+def dhash(image, hash_size=8):
+    # Difference hash: one bit per horizontally adjacent pixel pair of a tiny greyscale copy.
+    pixels = list(image.convert("L").resize((hash_size + 1, hash_size)).getdata())
+    value = 0
+    for row in range(hash_size):
+        offset = row * (hash_size + 1)
+        for col in range(hash_size):
+            value = (value << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+    return value
+
+def decode_thumbnail(content, size):
+    # Returns (width, height, raw RGB bytes, dHash) so only a small buffer crosses the process boundary.
+    image = Image.open(io.BytesIO(content))
+    image = image.convert("RGB").resize(size)
+    return image.size[0], image.size[1], image.tobytes(), dhash(image)
+
+def encode_thumbnail(thumb):
+    width, height, data = thumb[:3]
+    buffer = io.BytesIO()
+    Image.frombytes("RGB", (width, height), data).save(buffer, "JPEG", quality=90)
+    return buffer.getvalue()
+
+def thumbnail_to_photo(thumb):
+    width, height, data = thumb[:3]
+    return ImageTk.PhotoImage(Image.frombytes("RGB", (width, height), data))
+
+def _warm_worker():
+    return os.getpid()
+
+class CpuOffload:
+    MODES = ("thread", "process")
+
+    def __init__(self, mode="thread", workers=None):
+        self.mode = mode if mode in self.MODES else "thread"
+        self.workers = workers or max(1, min(4, (os.cpu_count() or 2) - 1))
+        self.pool = None
+        self.closed = False
+        self.lock = threading.Lock()
+        self.timings = {}
+
+    def warm(self):
+        # Returns the pool it created or found, or None once shut down.
+        with self.lock:
+            if self.closed:
+                return None
+            if self.pool is None:
+                self.pool = ProcessPoolExecutor(max_workers=self.workers)
+            pool = self.pool
+        # Fire-and-forget no-ops so every worker is spawned (and has imported PIL/bs4)
+        # before the first real job arrives.
+        try:
+            for _ in range(self.workers):
+                pool.submit(_warm_worker)
+        except RuntimeError:
+            pass  # Shut down meanwhile; run() falls back to inline on its own submit.
+        return pool
+
+    def set_mode(self, mode):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown offload mode: {mode}")
+        if mode == "process":
+            self.warm()
+        self.mode = mode
+
+    def run(self, stage, func, *args):
+        mode = self.mode
+        start = time.perf_counter()
+        pool = None
+        if mode == "process":
+            pool = self.pool
+            if pool is None:
+                pool = self.warm()
+        future = None
+        if pool is not None:
+            try:
+                future = pool.submit(func, *args)
+            except RuntimeError:
+                pass  # Pool already broken or shut down underneath us.
+        if future is not None:
+            try:
+                result = future.result()
+            except BrokenProcessPool:
+                future = None
+        if future is None:
+            # No usable pool: run inline. Errors raised by func itself propagate from result() above.
+            if pool is not None:
+                with self.lock:
+                    if self.pool is pool:
+                        self.pool = None
+            mode = "thread"
+            result = func(*args)
+        self.record(mode, stage, time.perf_counter() - start)
+        return result
+
+    def record(self, mode, stage, elapsed):
+        with self.lock:
+            entry = self.timings.setdefault((mode, stage), [0, 0.0, 0.0])
+            entry[0] += 1
+            entry[1] += elapsed
+            entry[2] = max(entry[2], elapsed)
+
+    def summary(self):
+        with self.lock:
+            items = sorted(self.timings.items())
+        if not items:
+            return "No offloaded work recorded yet."
+        lines = []
+        for (mode, stage), (count, total, worst) in items:
+            lines.append(f"{mode:>7} {stage:<10} {count:>5} calls  avg {total / count * 1000:7.1f} ms  "
+                         f"max {worst * 1000:7.1f} ms")
+        return "\n".join(lines)
+
+    def shutdown(self):
+        with self.lock:
+            self.closed = True
+            pool, self.pool = self.pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+OFFLOAD = CpuOffload(os.environ.get("HERBAL_CPU_MODE", "thread"))
+
+# ---------------- Perceptual-Hash Image Index ---------------- #
+# 64-bit dHashes split into eight 8-bit bands: two hashes within 7 bits of each other
+# must agree on at least one band, so near-duplicate lookup only scans matching buckets.
+DHASH_BANDS = 8
+NEAR_DUPLICATE_DISTANCE = 6
+
+def hamming_distance(a, b):
+    return bin(a ^ b).count("1")
+
+class ImageIndex:
+    def __init__(self, max_urls=5000):
+        self.max_urls = max_urls
+        self.url_hashes = OrderedDict()  # image URL -> canonical dHash, oldest first
+        self.hash_refs = Counter()  # canonical dHash -> number of URLs pointing at it
+        self.bands = {}  # (band, band value) -> canonical dHashes
+        self.lock = threading.Lock()
+
+    def band_keys(self, value):
+        return [(band, (value >> (band * 8)) & 0xFF) for band in range(DHASH_BANDS)]
+
+    def find_near(self, value):
+        best, best_distance = None, NEAR_DUPLICATE_DISTANCE + 1
+        for key in self.band_keys(value):
+            for candidate in self.bands.get(key, ()):
+                distance = hamming_distance(value, candidate)
+                if distance < best_distance:
+                    best, best_distance = candidate, distance
+        return best
+
+    def hash_for_url(self, url):
+        with self.lock:
+            return self.url_hashes.get(url)
+
+    def add(self, url, value):
+        # Returns the canonical hash: that of an already indexed near-duplicate, if any.
+        with self.lock:
+            canonical = self.find_near(value)
+            if canonical is None:
+                canonical = value
+            if url in self.url_hashes:
+                self.release(self.url_hashes.pop(url))
+            self.url_hashes[url] = canonical
+            if self.hash_refs[canonical] == 0:
+                for key in self.band_keys(canonical):
+                    self.bands.setdefault(key, set()).add(canonical)
+            self.hash_refs[canonical] += 1
+            while len(self.url_hashes) > self.max_urls:
+                _, oldest = self.url_hashes.popitem(last=False)
+                self.release(oldest)
+            return canonical
+
+    def release(self, canonical):
+        self.hash_refs[canonical] -= 1
+        if self.hash_refs[canonical] > 0:
+            return
+        del self.hash_refs[canonical]
+        for key in self.band_keys(canonical):
+            bucket = self.bands.get(key)
+            if bucket is not None:
+                bucket.discard(canonical)
+                if not bucket:
+                    del self.bands[key]
+
+    def items(self):
+        with self.lock:
+            return list(self.url_hashes.items())
+
+IMAGE_INDEX = ImageIndex()
+
+def cached_thumbnail(img_url, size):
+    canonical = IMAGE_INDEX.hash_for_url(img_url)
+    return THUMBNAIL_CACHE.get((canonical, size)) if canonical is not None else None
+
+def fetch_thumbnail(img_url, headers, size, timeout=10):
+    # URLs already known to hold an indexed image are served without a download.
+    thumb = cached_thumbnail(img_url, size)
+    if thumb is None:
+        img_resp = requests.get(img_url, headers=headers, timeout=timeout)
+        thumb = OFFLOAD.run("thumbnail", decode_thumbnail, img_resp.content, size)
+        canonical = IMAGE_INDEX.add(img_url, thumb[3])
+        held = THUMBNAIL_CACHE.get((canonical, size))
+        if held is not None:
+            return held
+        thumb = thumb[:3] + (canonical,)
+        THUMBNAIL_CACHE.put((canonical, size), thumb)
+    return thumb
+
+SEEN_IMAGES_LOCK = threading.Lock()
+
+def iter_distinct_thumbnails(img_urls, headers, size, limit, log_event, seen=None, deadline=None):
+    # Yields (url, thumbnail) for up to `limit` images, skipping near-duplicates of ones already yielded.
+    # Several lookups filling one grid share a `seen` set; `deadline` is a time.monotonic() value.
+    seen = set() if seen is None else seen
+    collapsed = 0
+    for img_url in img_urls:
+        if len(seen) >= limit:
+            break
+        timeout = 10
+        if deadline is not None:
+            timeout = min(timeout, deadline - time.monotonic())
+            if timeout <= 0:
+                break
+        try:
+            thumb = fetch_thumbnail(img_url, headers, size, timeout)
+        except Exception as e:
+            log_event(f"Error loading image from URL {img_url}: {e}")
+            continue
+        with SEEN_IMAGES_LOCK:
+            if len(seen) >= limit:
+                break
+            duplicate = thumb[3] in seen
+            if not duplicate:
+                seen.add(thumb[3])
+        if duplicate:
+            collapsed += 1
+            continue
+        yield img_url, thumb
+    if collapsed:
+        log_event(f"Collapsed {collapsed} near-duplicate image(s).")
+
+# ---------------- Fetch Scheduler ---------------- #
+# One app-wide worker pool. A task's class is worked out when a worker picks it up,
+# so switching notebook tabs re-ranks everything still queued.
+PRIORITY_FOREGROUND_TEXT = 0
+PRIORITY_FOREGROUND_IMAGES = 1
+PRIORITY_BACKGROUND = 2
+PRIORITY_PREFETCH = 3
+PRIORITY_NAMES = ("foreground text", "foreground images", "background tabs", "prefetch")
+
+class FetchScheduler:
+    def __init__(self, max_workers=6, foreground="herb"):
+        self.max_workers = max_workers
+        self.foreground = foreground
+        self.pending = []  # (sequence, tab_key, kind, func, args, submitted_at)
+        self.running = 0
+        self.workers = []
+        self.sequence = itertools.count()
+        self.condition = threading.Condition()
+        self.peak_depth = [0] * len(PRIORITY_NAMES)
+        self.waits = [[0, 0.0, 0.0] for _ in PRIORITY_NAMES]  # count, total, max seconds
+
+    def priority(self, tab_key, kind):
+        if kind == "prefetch":
+            return PRIORITY_PREFETCH
+        if tab_key != self.foreground:
+            return PRIORITY_BACKGROUND
+        return PRIORITY_FOREGROUND_IMAGES if kind == "images" else PRIORITY_FOREGROUND_TEXT
+
+    def submit(self, tab_key, kind, func, *args):
+        with self.condition:
+            if not self.workers:
+                for _ in range(self.max_workers):
+                    worker = threading.Thread(target=self.work, daemon=True)
+                    worker.start()
+                    self.workers.append(worker)
+            self.pending.append((next(self.sequence), tab_key, kind, func, args, time.monotonic()))
+            priority = self.priority(tab_key, kind)
+            self.peak_depth[priority] = max(self.peak_depth[priority], self.depths()[priority])
+            self.condition.notify()
+
+    def set_foreground(self, tab_key):
+        with self.condition:
+            self.foreground = tab_key
+
+    def depths(self):
+        depths = [0] * len(PRIORITY_NAMES)
+        for _, tab_key, kind, _, _, _ in self.pending:
+            depths[self.priority(tab_key, kind)] += 1
+        return depths
+
+    def is_idle(self):
+        with self.condition:
+            return not self.pending and self.running == 0
+
+    def work(self):
+        while True:
+            with self.condition:
+                while not self.pending:
+                    self.condition.wait()
+                task = min(self.pending, key=lambda t: (self.priority(t[1], t[2]), t[0]))
+                self.pending.remove(task)
+                _, tab_key, kind, func, args, submitted_at = task
+                waited = time.monotonic() - submitted_at
+                stats = self.waits[self.priority(tab_key, kind)]
+                stats[0] += 1
+                stats[1] += waited
+                stats[2] = max(stats[2], waited)
+                self.running += 1
+            try:
+                func(*args)
+            except Exception as e:
+                print(f"Scheduled {kind} task failed:", e)
+            finally:
+                with self.condition:
+                    self.running -= 1
+
+    def summary(self):
+        with self.condition:
+            depths = self.depths()
+            lines = [f"Workers: {self.max_workers}  running: {self.running}  foreground tab: {self.foreground}"]
+            for priority, name in enumerate(PRIORITY_NAMES):
+                count, total, worst = self.waits[priority]
+                average = total / count * 1000 if count else 0.0
+                lines.append(f"{name:<18} depth {depths[priority]:>3} (peak {self.peak_depth[priority]:>3})  "
+                             f"{count:>5} started  avg wait {average:7.1f} ms  max {worst * 1000:7.1f} ms")
+        return "\n".join(lines)
+
+SCHEDULER = FetchScheduler()
+
 # ---------------- AutocompleteEntry with Right-Click Paste ---------------- #
 class AutocompleteEntry(tk.Entry):
     def __init__(self, master, suggestion_fetcher, **kwargs):
         super().__init__(master, **kwargs)
         self.suggestion_fetcher = suggestion_fetcher
+        # The popup, its listbox and the context menu are built once and reused.
         self.suggestions_window = None
+        self.suggestions_listbox = None
+        self.suggestions_shown = False
+        self.context_menu = None
         self.bind("<KeyRelease>", self.on_keyrelease)
         self.bind("<FocusOut>", self.on_focus_out)
         self.bind("<Return>", self.on_return)
@@ -78,12 +503,13 @@ class AutocompleteEntry(tk.Entry):
         self.bind("<Button-3>", self.show_context_menu)
 
     def show_context_menu(self, event):
-        menu = tk.Menu(self, tearoff=0)
-        menu.add_command(label="Paste", command=self.paste_from_clipboard)
+        if self.context_menu is None:
+            self.context_menu = tk.Menu(self, tearoff=0)
+            self.context_menu.add_command(label="Paste", command=self.paste_from_clipboard)
         try:
-            menu.tk_popup(event.x_root, event.y_root)
+            self.context_menu.tk_popup(event.x_root, event.y_root)
         finally:
-            menu.grab_release()
+            self.context_menu.grab_release()
 
     def paste_from_clipboard(self):
         try:
@@ -96,7 +522,7 @@ class AutocompleteEntry(tk.Entry):
         self.after(100, self.hide_suggestions)
 
     def on_return(self, event):
-        if self.suggestions_window and self.suggestions_listbox.curselection():
+        if self.suggestions_shown and self.suggestions_listbox.curselection():
             index = self.suggestions_listbox.curselection()[0]
             value = self.suggestions_listbox.get(index)
             self.delete(0, tk.END)
@@ -117,24 +543,32 @@ class AutocompleteEntry(tk.Entry):
         else:
             self.hide_suggestions()
 
-    def show_suggestions(self, suggestions):
-        if self.suggestions_window:
-            self.suggestions_window.destroy()
+    def build_suggestions_window(self):
         self.suggestions_window = tk.Toplevel(self)
         self.suggestions_window.wm_overrideredirect(True)
+        self.suggestions_window.withdraw()
+        self.suggestions_listbox = tk.Listbox(self.suggestions_window)
+        self.suggestions_listbox.pack()
+        self.suggestions_listbox.bind("<ButtonRelease-1>", self.on_listbox_select)
+
+    def show_suggestions(self, suggestions):
+        if self.suggestions_window is None:
+            self.build_suggestions_window()
         x = self.winfo_rootx()
         y = self.winfo_rooty() + self.winfo_height()
         self.suggestions_window.wm_geometry("+%d+%d" % (x, y))
-        self.suggestions_listbox = tk.Listbox(self.suggestions_window, height=min(6, len(suggestions)))
-        self.suggestions_listbox.pack()
-        self.suggestions_listbox.bind("<ButtonRelease-1>", self.on_listbox_select)
-        for s in suggestions:
-            self.suggestions_listbox.insert(tk.END, s)
+        self.suggestions_listbox.delete(0, tk.END)
+        self.suggestions_listbox.insert(tk.END, *suggestions)
+        self.suggestions_listbox.config(height=min(6, len(suggestions)))
+        if not self.suggestions_shown:
+            self.suggestions_window.deiconify()
+            self.suggestions_window.lift()
+            self.suggestions_shown = True
 
     def hide_suggestions(self):
-        if self.suggestions_window:
-            self.suggestions_window.destroy()
-            self.suggestions_window = None
+        if self.suggestions_shown:
+            self.suggestions_window.withdraw()
+            self.suggestions_shown = False
 
     def on_listbox_select(self, event):
         if self.suggestions_listbox:
@@ -159,6 +593,64 @@ class MainApp:
         self.notebook.add(self.herb_tab.frame, text="Herbs")
         self.notebook.add(self.deep_learn_tab.frame, text="Deep Learn")
         self.notebook.add(self.general_tab.frame, text="General Search")
+        self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
+
+        # --------- Performance Menu (switch CPU offload mode at runtime) --------- #
+        menubar = tk.Menu(root)
+        perf_menu = tk.Menu(menubar, tearoff=0)
+        self.cpu_mode = tk.StringVar(value=OFFLOAD.mode)
+        perf_menu.add_radiobutton(label="Parse/Decode in Threads", variable=self.cpu_mode, value="thread",
+                                  command=self.on_cpu_mode_changed)
+        perf_menu.add_radiobutton(label="Parse/Decode in Process Pool", variable=self.cpu_mode, value="process",
+                                  command=self.on_cpu_mode_changed)
+        perf_menu.add_separator()
+        perf_menu.add_command(label="Show Offload Timings", command=self.show_offload_timings)
+        perf_menu.add_command(label="Show Scheduler Stats", command=self.show_scheduler_stats)
+        menubar.add_cascade(label="Performance", menu=perf_menu)
+        root.config(menu=menubar)
+
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.root.after(SNAPSHOT_INTERVAL_MS, self.autosave)
+
+    def collect_view_states(self):
+        return {
+            "herb": self.herb_tab.get_view_state(),
+            "deep": self.deep_learn_tab.get_view_state(),
+            "general": self.general_tab.get_view_state(),
+        }
+
+    def save_snapshot(self, views):
+        try:
+            SESSION.save(views)
+        except Exception as e:
+            print("Failed to save session snapshot:", e)
+
+    def autosave(self):
+        # View state is read on the Tk thread; encoding and writing happen off it.
+        views = self.collect_view_states()
+        threading.Thread(target=self.save_snapshot, args=(views,), daemon=True).start()
+        self.root.after(SNAPSHOT_INTERVAL_MS, self.autosave)
+
+    def on_close(self):
+        self.save_snapshot(self.collect_view_states())
+        self.herb_tab.csv_watcher.stop()
+        self.root.destroy()
+
+    def on_cpu_mode_changed(self):
+        OFFLOAD.set_mode(self.cpu_mode.get())
+        self.herb_tab.log_event(f"CPU offload mode set to: {OFFLOAD.mode}")
+
+    def show_offload_timings(self):
+        messagebox.showinfo("Offload Timings", OFFLOAD.summary())
+
+    def on_tab_changed(self, event):
+        selected = self.notebook.select()
+        for tab in (self.herb_tab, self.deep_learn_tab, self.general_tab):
+            if str(tab.frame) == selected:
+                SCHEDULER.set_foreground(tab.tab_key)
+
+    def show_scheduler_stats(self):
+        messagebox.showinfo("Scheduler Stats", SCHEDULER.summary())
 
 # ---------------- Common Language Data ---------------- #
 LANGUAGES = {
@@ -187,9 +679,276 @@ LANGUAGES = {
 }
 LANGUAGE_LIST = sorted(LANGUAGES.keys())
 
+# ---------------- Translation Helpers ---------------- #
+RECENT_LANGUAGES = []  # Non-English language codes, most recently selected first.
+MAX_RECENT_LANGUAGES = 3
+
+def translate_text(text, lang_code):
+    key = (lang_code, text)
+    translation = TRANSLATION_CACHE.get(key)
+    if translation is None:
+        translation = GoogleTranslator(source='auto', target=lang_code).translate(text)
+        TRANSLATION_CACHE.put(key, translation)
+    return translation
+
+def cached_translation(text, lang_code):
+    # The translation if it needs no network call, else None.
+    if lang_code == "en":
+        return text
+    return TRANSLATION_CACHE.get((lang_code, text))
+
+def translate_snippets(snippets, language, log_event):
+    lang_code = LANGUAGES.get(language, "en")
+    if lang_code == "en":
+        return "\n\nWeb Details (DuckDuckGo):\n", list(snippets)
+    translated_snippets = []
+    for s in snippets:
+        try:
+            translated_snippets.append(translate_text(s, lang_code))
+        except Exception as e:
+            log_event("Translation error: " + str(e))
+            translated_snippets.append(s)
+    return f"\n\nWeb Details (DuckDuckGo) in {language}:\n", translated_snippets
+
+def cached_snippet_translations(snippets, language):
+    # What translate_snippets would return, or None if any snippet still needs the translator.
+    lang_code = LANGUAGES.get(language, "en")
+    translated_snippets = [cached_translation(s, lang_code) for s in snippets]
+    if None in translated_snippets:
+        return None
+    if lang_code == "en":
+        return "\n\nWeb Details (DuckDuckGo):\n", translated_snippets
+    return f"\n\nWeb Details (DuckDuckGo) in {language}:\n", translated_snippets
+
+def remember_language(language):
+    lang_code = LANGUAGES.get(language, "en")
+    if lang_code == "en":
+        return
+    if lang_code in RECENT_LANGUAGES:
+        RECENT_LANGUAGES.remove(lang_code)
+    RECENT_LANGUAGES.insert(0, lang_code)
+    del RECENT_LANGUAGES[MAX_RECENT_LANGUAGES:]
+
+def prefetch_translations(texts, current_language):
+    # Warm the cache for the user's other recent languages so switching back is instant.
+    current_code = LANGUAGES.get(current_language, "en")
+    lang_codes = [code for code in RECENT_LANGUAGES if code != current_code]
+    if not texts or not lang_codes:
+        return
+
+    def worker():
+        for lang_code in lang_codes:
+            for text in texts:
+                try:
+                    translate_text(text, lang_code)
+                except Exception:
+                    return  # Translator unreachable; don't keep hammering it.
+    SCHEDULER.submit(None, "prefetch", worker)
+
+# ---------------- Session Snapshot (Warm Start) ---------------- #
+# Stored as zlib-compressed JSON (never pickle, so a tampered file can't run code);
+# tuple keys become lists and thumbnails base64 JPEG.
+SNAPSHOT_VERSION = 3
+SNAPSHOT_INTERVAL_MS = 5 * 60 * 1000
+SNAPSHOT_LIMITS = {"suggestions": 300, "snippets": 100, "translations": 500, "thumbnails": 60}
+
+class SessionStore:
+    def __init__(self, path, max_age=6 * 3600):
+        self.path = path
+        self.max_age = max_age
+        self.snapshot = None
+        self.loaded = False
+        self.lock = threading.Lock()
+        self.save_lock = threading.Lock()
+
+    def load(self):
+        # Read on first use only, so a missing or broken file never delays start-up.
+        with self.lock:
+            if self.loaded:
+                return self.snapshot
+            self.loaded = True
+            try:
+                with open(self.path, "rb") as f:
+                    snapshot = json.loads(zlib.decompress(f.read()).decode("utf-8"))
+            except FileNotFoundError:
+                return None
+            except Exception as e:
+                print("Ignoring unreadable session snapshot:", e)
+                return None
+            if not self.snapshot_is_valid(snapshot):
+                print("Ignoring malformed session snapshot.")
+                return None
+            try:
+                self.restore_caches(snapshot)
+            except Exception as e:
+                print("Ignoring malformed session snapshot:", e)
+                return None
+            self.snapshot = snapshot
+            return snapshot
+
+    def snapshot_is_valid(self, snapshot):
+        # Only the shape the tabs and restore_caches rely on; anything else is from another version.
+        if not isinstance(snapshot, dict) or snapshot.get("version") != SNAPSHOT_VERSION:
+            return False
+        views = snapshot.get("views")
+        return (isinstance(snapshot.get("saved_at"), (int, float))
+                and isinstance(views, dict) and all(isinstance(view, dict) for view in views.values())
+                and isinstance(snapshot.get("caches"), dict))
+
+    def is_stale(self):
+        return self.snapshot_is_stale(self.load())
+
+    def snapshot_is_stale(self, snapshot):
+        return snapshot is None or time.time() - snapshot.get("saved_at", 0) > self.max_age
+
+    def view_state(self, tab_key):
+        snapshot = self.load()
+        return snapshot["views"].get(tab_key) if snapshot else None
+
+    def restore_caches(self, snapshot):
+        entries = snapshot.get("caches", {})
+        for key, value in entries.get("suggestions", []):
+            SUGGESTION_CACHE.put(key, value)
+        for (lang_code, text), value in entries.get("translations", []):
+            TRANSLATION_CACHE.put((lang_code, text), value)
+        if not self.snapshot_is_stale(snapshot):
+            # Search results age; only reuse them while the snapshot is fresh.
+            for key, value in entries.get("snippets", []):
+                SNIPPET_CACHE.put(key, value)
+        for (canonical, size), blob in entries.get("thumbnails", []):
+            size = tuple(size)
+            try:
+                thumb = decode_thumbnail(base64.b64decode(blob), size)
+            except Exception:
+                continue
+            THUMBNAIL_CACHE.put((canonical, size), thumb[:3] + (canonical,))
+        for url, canonical in entries.get("image_urls", []):
+            IMAGE_INDEX.add(url, canonical)
+        RECENT_LANGUAGES[:] = snapshot.get("recent_languages", [])[:MAX_RECENT_LANGUAGES]
+
+    def save(self, views):
+        thumbnails = dict(THUMBNAIL_CACHE.items(SNAPSHOT_LIMITS["thumbnails"]))
+        for view in views.values():
+            size = tuple(view.get("image_size", ()))
+            for url in view.get("images", []):
+                canonical = IMAGE_INDEX.hash_for_url(url)
+                thumb = THUMBNAIL_CACHE.get((canonical, size))
+                if thumb is not None:
+                    thumbnails[(canonical, size)] = thumb
+        saved_hashes = {canonical for canonical, _ in thumbnails}
+        snapshot = {
+            "version": SNAPSHOT_VERSION,
+            "saved_at": time.time(),
+            "views": views,
+            "recent_languages": list(RECENT_LANGUAGES),
+            "caches": {
+                "suggestions": SUGGESTION_CACHE.items(SNAPSHOT_LIMITS["suggestions"]),
+                "snippets": SNIPPET_CACHE.items(SNAPSHOT_LIMITS["snippets"]),
+                "translations": [(list(key), value) for key, value in
+                                 TRANSLATION_CACHE.items(SNAPSHOT_LIMITS["translations"])],
+                "thumbnails": [([canonical, list(size)],
+                                base64.b64encode(encode_thumbnail(thumb)).decode("ascii"))
+                               for (canonical, size), thumb in thumbnails.items()],
+                "image_urls": [(url, canonical) for url, canonical in IMAGE_INDEX.items()
+                               if canonical in saved_hashes],
+            },
+        }
+        blob = zlib.compress(json.dumps(snapshot).encode("utf-8"))
+        with self.save_lock:
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(blob)
+            os.replace(tmp_path, self.path)
+
+SESSION = SessionStore("session_snapshot.bin")
+
+# ---------------- herbal.csv Hot Reload ---------------- #
+# Each non-blank line is treated as one row; rows are remembered by their raw line text
+# so a rescan only has to parse lines that were not in the previous version of the file.
+class CsvWatcher:
+    def __init__(self, filename, on_change, interval=1.5):
+        self.filename = filename
+        self.on_change = on_change
+        self.interval = interval
+        self.signature = None
+        self.header = None
+        self.dialect = csv.excel
+        self.line_counts = Counter()
+        self.rows_by_line = {}
+        self.stop_event = threading.Event()
+
+    def file_signature(self):
+        stat = os.stat(self.filename)
+        return stat.st_mtime_ns, stat.st_size
+
+    def parse_lines(self, lines):
+        reader = csv.DictReader([self.header] + lines, dialect=self.dialect)
+        return [{k.strip(): v for k, v in row.items() if k is not None} for row in reader]
+
+    def scan(self):
+        signature = self.file_signature()
+        with open(self.filename, newline="", encoding="utf-8-sig", errors='replace') as csvfile:
+            text = csvfile.read()
+        lines = [line for line in text.splitlines() if line.strip()]
+        header, body = (lines[0], lines[1:]) if lines else ("", [])
+        removed = []
+        if header != self.header:
+            # New columns or delimiter: nothing from the old parse can be reused.
+            try:
+                self.dialect = csv.Sniffer().sniff(text[:1024])
+            except Exception:
+                self.dialect = csv.excel_tab
+            for line, count in self.line_counts.items():
+                removed.extend([self.rows_by_line[line]] * count)
+            self.header = header
+            self.line_counts = Counter()
+            self.rows_by_line = {}
+        new_counts = Counter(body)
+        for line, count in self.line_counts.items():
+            extra = count - new_counts.get(line, 0)
+            if extra > 0:
+                removed.extend([self.rows_by_line[line]] * extra)
+        added_lines = []
+        for line, count in new_counts.items():
+            extra = count - self.line_counts.get(line, 0)
+            if extra > 0:
+                added_lines.extend([line] * extra)
+        added = self.parse_lines(added_lines) if added_lines else []
+        for line, row in zip(added_lines, added):
+            self.rows_by_line.setdefault(line, row)
+        for line in list(self.rows_by_line):
+            if line not in new_counts:
+                del self.rows_by_line[line]
+        self.line_counts = new_counts
+        self.signature = signature
+        return added, removed
+
+    def start(self):
+        threading.Thread(target=self.watch, daemon=True).start()
+
+    def stop(self):
+        self.stop_event.set()
+
+    def watch(self):
+        # A stat() every interval is all the steady state costs; the file is only
+        # read again once its mtime or size actually changes.
+        while not self.stop_event.wait(self.interval):
+            try:
+                if self.file_signature() == self.signature:
+                    continue
+                added, removed = self.scan()
+            except (OSError, csv.Error):
+                continue  # File missing or mid-write; try again on the next tick.
+            if added or removed:
+                self.on_change(added, removed)
+
 # ---------------- HerbTab with Search Bar, Right-Click Copy & Paste ---------------- #
+AGGREGATE_DEADLINE = 12.0  # Seconds shared by all lookups behind one disease view.
+AGGREGATE_MAX_SNIPPETS = 12
+AGGREGATE_MAX_HERBS = 4  # With the disease itself, one wave of scheduler workers; the rest stay links.
 class HerbTab:
     def __init__(self, parent):
+        self.tab_key = "herb"
         self.frame = tk.Frame(parent)
         # --------- Disease/Illness Selection Panel --------- #
         top_frame = tk.Frame(self.frame, bg="lightgrey")
@@ -217,6 +976,7 @@ class HerbTab:
         self.language_combo['values'] = LANGUAGE_LIST
         self.language_combo.set("English")
         self.language_combo.pack(side=tk.LEFT, padx=5)
+        self.language_combo.bind("<<ComboboxSelected>>", self.on_language_changed)
 
         # --------- Main Content Panels --------- #
         main_frame = tk.Frame(self.frame)
@@ -259,12 +1019,35 @@ class HerbTab:
         self.console_text = tk.Text(console_frame, height=5, state="disabled", font=("Helvetica", 10))
         self.console_text.pack(fill=tk.X)
 
-        self.herb_data = self.load_csv("herbal.csv")
-        diseases = sorted({row["Disease/Illness"] for row in self.herb_data})
-        self.disease_combo['values'] = diseases
-        if diseases:
+        # Source-language (English) text currently shown in output_text, so a language
+        # change can re-translate it without refetching anything.
+        self.output_base = ""
+        self.output_sections = []
+        self.view_query = None  # Free-text query behind the results, or None for a disease view.
+        self.view_id = 0  # Bumped whenever the output is cleared for a new search or disease.
+        self.image_urls = []
+        # Merged results of the parallel per-herb lookups for the current disease view.
+        self.aggregate_id = 0
+        self.aggregate_snippets = {}  # normalized snippet -> [text, sources, first seen]
+        self.aggregate_terms = []
+        self.aggregate_images_started = False
+
+        self.disease_rows = {}  # normalized disease -> rows, in file order
+        self.disease_counts = Counter()  # raw disease name -> row count
+        self.diseases = []  # sorted combobox values
+        self.csv_values_dirty = False
+        self.csv_watcher = CsvWatcher("herbal.csv", self.on_csv_changed)
+        self.apply_csv_changes([(1, row) for row in self.load_csv()])
+        self.disease_combo['values'] = self.diseases
+        state = SESSION.view_state("herb")
+        if state and state.get("disease") in self.disease_counts:
+            self.restore_view_state(state)
+            if SESSION.is_stale():
+                self.refresh_view()
+        elif self.diseases:
             self.disease_combo.current(0)
             self.on_disease_selected(None)
+        self.csv_watcher.start()
         self.log_event("Herb tab loaded.")
 
     def show_output_context_menu(self, event):
@@ -281,51 +1064,60 @@ class HerbTab:
             return
         self.output_text.config(state="normal")
         self.output_text.delete("1.0", tk.END)
-        for widget in self.image_frame.winfo_children():
-            widget.destroy()
+        self.output_base = ""
+        self.output_sections = []
+        self.view_query = query
+        self.view_id += 1
+        self.aggregate_id += 1
+        self.clear_images()
         self.log_event(f"Herb tab search initiated for: {query}")
-        threading.Thread(target=self.update_output_with_details, args=(query,), daemon=True).start()
-        threading.Thread(target=self.show_images_grid, args=(query,), daemon=True).start()
+        SCHEDULER.submit(self.tab_key, "text", self.update_output_with_details, self.view_id, query)
+        SCHEDULER.submit(self.tab_key, "images", self.show_images_grid, query)
 
-    def on_disease_selected(self, event):
+    def on_disease_selected(self, event, fetch=True):
         disease = self.disease_combo.get()
         self.detail_text.config(state="normal")
         self.detail_text.delete("1.0", tk.END)
         self.output_text.config(state="normal")
         self.output_text.delete("1.0", tk.END)
-        for widget in self.image_frame.winfo_children():
-            widget.destroy()
+        self.output_base = ""
+        self.output_sections = []
+        self.view_query = None
+        self.view_id += 1
+        self.clear_images()
 
-        selected_row = None
-        for row in self.herb_data:
-            if row["Disease/Illness"].strip().lower() == disease.strip().lower():
-                selected_row = row
-                break
+        matching_rows = self.disease_rows.get(disease.strip().lower())
+        selected_row = matching_rows[0] if matching_rows else None
 
         if selected_row:
             disease_val = selected_row.get("Disease/Illness", "N/A")
-            herb_val = selected_row.get("Herb", "N/A")
-            parts_val = selected_row.get("Parts", "N/A")
+            herbs = self.herbs_for_disease(disease)
             self.detail_text.insert(tk.END, "Disease/Illness: ", "label")
             self.detail_text.insert(tk.END, disease_val, "disease")
-            self.detail_text.insert(tk.END, "\nHerb: ", "label")
-            self.detail_text.insert(tk.END, herb_val, "herb")
-            self.detail_text.insert(tk.END, "\nParts: ", "label")
-            self.detail_text.insert(tk.END, parts_val, "parts")
+            # Every herb and part is its own link: tags "herb_0", "parts_0", ... carry the bindings.
+            for field, label, position in (("herb", "\nHerb: ", 0), ("parts", "\nParts: ", 1)):
+                self.detail_text.insert(tk.END, label, "label")
+                for index, entry in enumerate(herbs):
+                    if index:
+                        self.detail_text.insert(tk.END, ", ")
+                    value = entry[position]
+                    self.detail_text.insert(tk.END, value, (field, f"{field}_{index}"))
+                    self.detail_text.tag_bind(f"{field}_{index}", "<Button-1>",
+                                                lambda e, f=field, val=value: self.handle_field_click(f, val))
             self.detail_text.tag_config("disease", foreground="blue", underline=1)
             self.detail_text.tag_bind("disease", "<Button-1>",
                                         lambda e, val=disease_val: self.handle_field_click("disease", val))
             self.detail_text.tag_config("herb", foreground="blue", underline=1)
-            self.detail_text.tag_bind("herb", "<Button-1>",
-                                        lambda e, val=herb_val: self.handle_field_click("herb", val))
             self.detail_text.tag_config("parts", foreground="blue", underline=1)
-            self.detail_text.tag_bind("parts", "<Button-1>",
-                                        lambda e, val=parts_val: self.handle_field_click("parts", val))
             self.detail_text.config(state="disabled")
-            details = f"Disease/Illness: {disease_val}\nHerb: {herb_val}\nParts: {parts_val}\n"
+            details = f"Disease/Illness: {disease_val}\n"
+            details += "".join(f"Herb: {herb_val}\nParts: {parts_val}\n" for herb_val, parts_val in herbs)
+            self.output_base = details
             self.output_text.insert(tk.END, details)
-            self.log_event(f"Disease selected: {disease_val} (Herb: {herb_val}, Parts: {parts_val})")
-            self.handle_field_click("disease", disease_val)
+            self.log_event(f"Disease selected: {disease_val} "
+                           f"(Herbs: {', '.join(herb_val for herb_val, _ in herbs) or 'N/A'})")
+            if fetch:
+                self.start_disease_lookups(disease_val, herbs)
         else:
             self.detail_text.insert(tk.END, "No data found for the selected disease.")
             self.log_event("No data found for the selected disease.")
@@ -334,60 +1126,207 @@ class HerbTab:
     def on_go_clicked(self):
         self.on_disease_selected(None)
 
+    def herbs_for_disease(self, disease):
+        herbs = []
+        for row in self.disease_rows.get(disease.strip().lower(), []):
+            entry = ((row.get("Herb") or "N/A").strip(), (row.get("Parts") or "N/A").strip())
+            if entry not in herbs:
+                herbs.append(entry)
+        return herbs
+
+    def start_disease_lookups(self, disease, herbs):
+        # One details and one image lookup for the disease and for each of its first few herbs, all
+        # queued at once under a shared deadline, so the view is ready about when the slowest returns.
+        self.aggregate_id += 1
+        view_id = self.aggregate_id
+        deadline = time.monotonic() + AGGREGATE_DEADLINE
+        self.aggregate_snippets = {}
+        self.aggregate_terms = [disease.lower()] + [herb.lower() for herb, _ in herbs if herb != "N/A"]
+        self.aggregate_images_started = False
+        seen_images = set()
+        parts_by_herb = {}
+        for herb, parts in herbs:
+            parts_by_herb.setdefault(herb, []).append(parts)
+        queried = list(parts_by_herb.items())[:AGGREGATE_MAX_HERBS]
+        lookups = [(f"{disease} remedy preparation cure", disease)]
+        lookups += [(f"{herb} {', '.join(parts)} for {disease} remedy", f"{herb} {parts[0]}")
+                    for herb, parts in queried]
+        self.log_event(f"Looking up {len(lookups)} sources for '{disease}' in parallel.")
+        if len(parts_by_herb) > len(queried):
+            self.log_event(f"{len(parts_by_herb) - len(queried)} more herb(s) are listed as links only.")
+        for details_query, image_query in lookups:
+            SCHEDULER.submit(self.tab_key, "text", self.fetch_aggregate_details, view_id, details_query, deadline)
+            SCHEDULER.submit(self.tab_key, "images", self.fetch_aggregate_images,
+                             view_id, image_query, deadline, seen_images)
+
+    def fetch_aggregate_details(self, view_id, query, deadline):
+        remaining = deadline - time.monotonic()
+        if view_id != self.aggregate_id or remaining <= 0:
+            return
+        snippets = self.fetch_snippets_from_duckduckgo(query, timeout=min(10, remaining))
+        if snippets and time.monotonic() <= deadline:
+            self.output_text.after(0, lambda: self.merge_aggregate_snippets(view_id, snippets))
+
+    def merge_aggregate_snippets(self, view_id, snippets):
+        if view_id != self.aggregate_id:
+            return
+        for text in snippets:
+            key = re.sub(r"\W+", " ", text.lower()).strip()
+            entry = self.aggregate_snippets.get(key)
+            if entry:
+                entry[1] += 1
+            else:
+                self.aggregate_snippets[key] = [text, 1, len(self.aggregate_snippets)]
+        # Rank by how many lookups returned a snippet plus how many of the view's herbs
+        # and the disease it mentions; ties keep arrival order.
+        ranked = sorted(self.aggregate_snippets.values(),
+                        key=lambda e: (-(e[1] + sum(term in e[0].lower() for term in self.aggregate_terms)), e[2]))
+        details = "\n\n".join(e[0] for e in ranked[:AGGREGATE_MAX_SNIPPETS])
+        # The merged block is always the first section: details from earlier views are dropped by
+        # view_id, and a field click ends merging before its own section is appended.
+        if self.output_sections:
+            self.output_sections[0] = details
+        else:
+            self.output_sections.append(details)
+        self.rerender_output()
+
+    def fetch_aggregate_images(self, view_id, query, deadline, seen_images):
+        remaining = deadline - time.monotonic()
+        if view_id != self.aggregate_id or remaining <= 0 or len(seen_images) >= 9:
+            return
+        url = "https://www.google.com/search?tbm=isch&q=" + urllib.parse.quote(query)
+        headers = {"User-Agent": "Mozilla/5.0"}
+        self.log_event(f"Fetching images for: {query}")
+        try:
+            response = requests.get(url, headers=headers, timeout=min(10, remaining))
+            if response.status_code != 200:
+                raise Exception("Image search failed")
+            img_urls = OFFLOAD.run("images", extract_image_urls, response.text, 18)
+        except Exception as e:
+            self.log_event(f"Error fetching images for '{query}': {e}")
+            return
+        thumbs = iter_distinct_thumbnails(img_urls, headers, (200, 200), 9, self.log_event,
+                                          seen=seen_images, deadline=deadline)
+        for img_url, thumb in thumbs:
+            if view_id != self.aggregate_id:
+                break
+            self.image_frame.after(0, lambda u=img_url, t=thumb: self.add_aggregate_image(view_id, u, t))
+
+    def add_aggregate_image(self, view_id, img_url, thumb):
+        if view_id != self.aggregate_id:
+            return
+        if not self.aggregate_images_started:
+            # Replace whatever was shown before (e.g. a restored snapshot) only once new images arrive.
+            self.aggregate_images_started = True
+            self.clear_images()
+        if len(self.image_urls) < 9:
+            self.add_image(len(self.image_urls), img_url, thumb)
+
     def handle_field_click(self, field, value):
+        # The clicked field takes over the image grid and appends to the output, so the
+        # disease view's remaining lookups must not merge into either any more.
+        self.aggregate_id += 1
         query_for_details = f"{value} remedy preparation cure"
         self.log_event(f"Searching details for '{value}' (field: {field})")
-        threading.Thread(target=self.update_output_with_details, args=(query_for_details,), daemon=True).start()
-        threading.Thread(target=self.show_images_grid, args=(value,), daemon=True).start()
+        SCHEDULER.submit(self.tab_key, "text", self.update_output_with_details, self.view_id, query_for_details)
+        SCHEDULER.submit(self.tab_key, "images", self.show_images_grid, value)
 
     def fetch_details_from_duckduckgo(self, query):
+        snippets = self.fetch_snippets_from_duckduckgo(query)
+        return "\n\n".join(snippets) if snippets is not None else None
+
+    def fetch_snippets_from_duckduckgo(self, query, timeout=10):
         query_encoded = urllib.parse.quote(query)
         url = "https://html.duckduckgo.com/html/?q=" + query_encoded
         headers = {"User-Agent": "Mozilla/5.0"}
         self.log_event(f"Fetching details for: {query}")
         try:
-            response = requests.get(url, headers=headers, timeout=10)
-            if response.status_code != 200:
-                raise Exception("Request failed")
-            html = response.text
-            soup = BeautifulSoup(html, "html.parser")
-            snippets = []
-            for result in soup.find_all("div", class_="result"):
-                snippet = result.find("a", class_="result__snippet") or result.find("div", class_="result__snippet")
-                if snippet:
-                    text = snippet.get_text().strip()
-                    if text and len(text.split()) > 5:
-                        snippets.append(text)
-                if len(snippets) >= 5:
-                    break
-            details = "\n\n".join(snippets)
-            return details
+            snippets = SNIPPET_CACHE.get(url)
+            if snippets is None:
+                response = requests.get(url, headers=headers, timeout=timeout)
+                if response.status_code != 200:
+                    raise Exception("Request failed")
+                snippets = OFFLOAD.run("snippets", extract_snippets, response.text)
+                if snippets:
+                    SNIPPET_CACHE.put(url, snippets)
+            return snippets
         except Exception as e:
             self.log_event(f"Error fetching details: {e}")
             return None
 
-    def update_output_with_details(self, query):
+    def update_output_with_details(self, view_id, query):
         details = self.fetch_details_from_duckduckgo(query)
         if details:
-            if hasattr(self, "language_combo"):
-                selected_language = self.language_combo.get() if self.language_combo.get() else "English"
-                lang_code = LANGUAGES.get(selected_language, "en")
-                if lang_code != "en":
-                    try:
-                        details = GoogleTranslator(source='auto', target=lang_code).translate(details)
-                        details = f"\n\nAdditional Details (in {selected_language}):\n" + details
-                    except Exception as e:
-                        self.log_event("Translation error: " + str(e))
-                        details = "\n\nAdditional Details:\n" + details
-                else:
-                    details = "\n\nAdditional Details:\n" + details
-            else:
-                details = "\n\nAdditional Details:\n" + details
-            self.output_text.after(0, lambda: self.append_details_to_output(details))
+            selected_language = self.language_combo.get() if self.language_combo.get() else "English"
+            formatted = self.format_details(details, selected_language)
+            self.output_text.after(0, lambda: self.append_details_to_output(view_id, details, formatted,
+                                                                            selected_language))
+            prefetch_translations([details], selected_language)
 
-    def append_details_to_output(self, details):
+    def format_details(self, details, language):
+        lang_code = LANGUAGES.get(language, "en")
+        if lang_code != "en":
+            try:
+                return f"\n\nAdditional Details (in {language}):\n" + translate_text(details, lang_code)
+            except Exception as e:
+                self.log_event("Translation error: " + str(e))
+        return "\n\nAdditional Details:\n" + details
+
+    def format_cached_details(self, details, language):
+        # Like format_details, but None instead of a network call when the translation isn't cached.
+        lang_code = LANGUAGES.get(language, "en")
+        translation = cached_translation(details, lang_code)
+        if translation is None:
+            return None
+        if lang_code != "en":
+            return f"\n\nAdditional Details (in {language}):\n" + translation
+        return "\n\nAdditional Details:\n" + translation
+
+    def rerender_output(self):
+        # Redraw every section in the current language: straight away when nothing needs
+        # translating, otherwise on a worker.
+        language = self.language_combo.get() or "English"
+        sections = list(self.output_sections)
+        formatted = [self.format_cached_details(details, language) for details in sections]
+        if None in formatted:
+            SCHEDULER.submit(self.tab_key, "text", self.retranslate_output, sections, language)
+        else:
+            self.redraw_output(sections, language, formatted)
+
+    def append_details_to_output(self, view_id, details, formatted, language):
+        # Drop details fetched for a search or disease that has since been replaced.
+        if view_id != self.view_id:
+            return
+        self.output_sections.append(details)
         self.output_text.config(state="normal")
-        self.output_text.insert(tk.END, details)
+        self.output_text.insert(tk.END, formatted)
+        self.output_text.config(state="disabled")
+        if language != (self.language_combo.get() or "English"):
+            # Formatted before a language change landed; bring the whole output up to date.
+            self.rerender_output()
+
+    def on_language_changed(self, event):
+        language = self.language_combo.get() or "English"
+        remember_language(language)
+        if self.output_sections:
+            self.log_event(f"Re-translating displayed details into {language}.")
+            self.rerender_output()
+
+    def retranslate_output(self, sections, language):
+        formatted = [self.format_details(details, language) for details in sections]
+        self.output_text.after(0, lambda: self.redraw_output(sections, language, formatted))
+
+    def redraw_output(self, sections, language, formatted):
+        # Another language change has its own re-translation queued; drop this one.
+        if language != (self.language_combo.get() or "English"):
+            return
+        if sections != self.output_sections:
+            # Sections arrived meanwhile and may be in either language; translate them all again.
+            self.rerender_output()
+            return
+        self.output_text.config(state="normal")
+        self.output_text.delete("1.0", tk.END)
+        self.output_text.insert(tk.END, self.output_base + "".join(formatted))
         self.output_text.config(state="disabled")
 
     def show_images_grid(self, query):
@@ -398,73 +1337,162 @@ class HerbTab:
             response = requests.get(url, headers=headers, timeout=10)
             if response.status_code != 200:
                 raise Exception("Image search failed")
-            soup = BeautifulSoup(response.text, "html.parser")
-            img_urls = []
-            for tag in soup.find_all("img"):
-                src = tag.get("data-src") or tag.get("src")
-                if src and src.startswith("http") and src not in img_urls:
-                    img_urls.append(src)
-                if len(img_urls) >= 9:
-                    break
-            for widget in self.image_frame.winfo_children():
-                widget.destroy()
-            photos = []
-            columns = 3
-            for index, img_url in enumerate(img_urls):
-                try:
-                    img_resp = requests.get(img_url, headers=headers, timeout=10)
-                    image = Image.open(io.BytesIO(img_resp.content))
-                    image = image.resize((200, 200))
-                    photo = ImageTk.PhotoImage(image)
-                    photos.append(photo)
-                    container = tk.Frame(self.image_frame, bd=1, relief=tk.RAISED)
-                    container.grid(row=index // columns, column=index % columns, padx=5, pady=5)
-                    img_label = tk.Label(container, image=photo, cursor="hand2")
-                    img_label.pack()
-                    img_label.bind("<Button-1>", lambda e, url=img_url: self.on_image_click(url))
-                except Exception as e:
-                    self.log_event(f"Error loading image from URL {img_url}: {e}")
-            self.image_frame.photos = photos  # Prevent garbage collection.
+            # Extra candidates let slots freed by near-duplicates go to distinct images.
+            img_urls = OFFLOAD.run("images", extract_image_urls, response.text, 18)
+            self.image_frame.after(0, self.clear_images)
+            thumbs = iter_distinct_thumbnails(img_urls, headers, (200, 200), 9, self.log_event)
+            for index, (img_url, thumb) in enumerate(thumbs):
+                self.image_frame.after(0, lambda i=index, u=img_url, t=thumb: self.add_image(i, u, t))
         except Exception as e:
             self.log_event(f"Error fetching images for '{query}': {e}")
             messagebox.showerror("Image Error", f"Could not fetch images for '{query}'.")
 
+    def clear_images(self):
+        for widget in self.image_frame.winfo_children():
+            widget.destroy()
+        self.image_frame.photos = []  # Prevent garbage collection.
+        self.image_urls = []
+
+    def add_image(self, index, img_url, thumb):
+        columns = 3
+        photo = thumbnail_to_photo(thumb)
+        self.image_frame.photos.append(photo)
+        self.image_urls.append(img_url)
+        container = tk.Frame(self.image_frame, bd=1, relief=tk.RAISED)
+        container.grid(row=index // columns, column=index % columns, padx=5, pady=5)
+        img_label = tk.Label(container, image=photo, cursor="hand2")
+        img_label.pack()
+        img_label.bind("<Button-1>", lambda e, url=img_url: self.on_image_click(url))
+
     def on_image_click(self, url):
         messagebox.showinfo("Image Details", f"Image URL:\n{url}")
         self.log_event("Image clicked: " + url)
 
-    def load_csv(self, filename):
+    def get_view_state(self):
+        return {
+            "disease": self.disease_combo.get(),
+            "query": self.view_query,
+            "language": self.language_combo.get(),
+            "output_sections": list(self.output_sections),
+            "images": list(self.image_urls),
+            "image_size": (200, 200),
+        }
+
+    def restore_view_state(self, state):
+        # Rebuilt purely from the snapshot and the in-memory caches; no network calls.
+        self.language_combo.set(state.get("language") or "English")
+        self.disease_combo.set(state["disease"])
+        self.on_disease_selected(None, fetch=False)
+        if state.get("query"):
+            self.search_entry.insert(0, state["query"])
+            self.output_text.config(state="normal")
+            self.output_text.delete("1.0", tk.END)
+            self.output_text.config(state="disabled")
+            self.output_base = ""
+            self.view_query = state["query"]
+        self.output_sections = list(state.get("output_sections", []))
+        if self.output_sections:
+            self.rerender_output()
+        for img_url in state.get("images", []):
+            thumb = cached_thumbnail(img_url, (200, 200))
+            if thumb is not None:
+                self.add_image(len(self.image_urls), img_url, thumb)
+        self.log_event("Restored last session from snapshot.")
+
+    def refresh_view(self):
+        self.log_event("Session snapshot is stale; refreshing in the background.")
+        if self.view_query:
+            SCHEDULER.submit(self.tab_key, "text", self.refresh_output, self.view_id, self.view_query)
+            SCHEDULER.submit(self.tab_key, "images", self.show_images_grid, self.view_query)
+        else:
+            disease = self.disease_combo.get()
+            self.start_disease_lookups(disease, self.herbs_for_disease(disease))
+
+    def refresh_output(self, view_id, query):
+        details = self.fetch_details_from_duckduckgo(query)
+        if details:
+            language = self.language_combo.get() if self.language_combo.get() else "English"
+            formatted = self.format_details(details, language)
+            self.output_text.after(0, lambda: self.replace_output(view_id, details, formatted, language))
+
+    def replace_output(self, view_id, details, formatted, language):
+        if view_id != self.view_id:
+            return
+        self.output_sections = [details]
+        self.output_text.config(state="normal")
+        self.output_text.delete("1.0", tk.END)
+        self.output_text.insert(tk.END, self.output_base + formatted)
+        self.output_text.config(state="disabled")
+        if language != (self.language_combo.get() or "English"):
+            self.rerender_output()
+
+    def load_csv(self):
         data = []
         try:
-            with open(filename, newline="", encoding="utf-8-sig", errors='replace') as csvfile:
-                sample = csvfile.read(1024)
-                csvfile.seek(0)
-                try:
-                    dialect = csv.Sniffer().sniff(sample)
-                except Exception:
-                    dialect = csv.excel
-                    dialect.delimiter = "\t"
-                reader = csv.DictReader(csvfile, dialect=dialect)
-                for row in reader:
-                    cleaned_row = {k.strip(): v for k, v in row.items()}
-                    data.append(cleaned_row)
+            # The first scan returns every row as added and primes the watcher's baseline.
+            data, _ = self.csv_watcher.scan()
             if data:
                 print("CSV keys:", data[0].keys())
-            self.log_event(f"CSV file '{filename}' loaded successfully.")
+            self.log_event(f"CSV file '{self.csv_watcher.filename}' loaded successfully.")
         except Exception as e:
             messagebox.showerror("Error", f"Error loading CSV file: {e}")
             self.log_event(f"Error loading CSV file: {e}")
         return data
 
+    def on_csv_changed(self, added, removed):
+        # Called on the watcher thread; logging and index updates happen on the Tk thread.
+        changes = [(-1, row) for row in removed] + [(1, row) for row in added]
+        self.frame.after(0, lambda: self.apply_csv_reload(changes, len(added), len(removed)))
+
+    def apply_csv_reload(self, changes, added_count, removed_count):
+        self.log_event(f"herbal.csv changed: {added_count} row(s) added, {removed_count} row(s) removed.")
+        self.apply_csv_changes_batched(changes, 0)
+
+    def apply_csv_changes_batched(self, changes, start, batch_size=5000):
+        end = start + batch_size
+        values_changed = self.apply_csv_changes(changes[start:end])
+        self.csv_values_dirty = self.csv_values_dirty or values_changed
+        if end < len(changes):
+            self.frame.after(1, lambda: self.apply_csv_changes_batched(changes, end, batch_size))
+        elif self.csv_values_dirty:
+            self.csv_values_dirty = False
+            current = self.disease_combo.get()
+            self.disease_combo['values'] = self.diseases
+            self.disease_combo.set(current)
+
+    def apply_csv_changes(self, changes):
+        values_changed = False
+        for sign, row in changes:
+            name = row.get("Disease/Illness") or ""
+            key = name.strip().lower()
+            if sign > 0:
+                self.disease_rows.setdefault(key, []).append(row)
+                self.disease_counts[name] += 1
+                if self.disease_counts[name] == 1:
+                    bisect.insort(self.diseases, name)
+                    values_changed = True
+            else:
+                rows = self.disease_rows.get(key)
+                if rows and row in rows:
+                    rows.remove(row)
+                    if not rows:
+                        del self.disease_rows[key]
+                self.disease_counts[name] -= 1
+                if self.disease_counts[name] <= 0:
+                    del self.disease_counts[name]
+                    index = bisect.bisect_left(self.diseases, name)
+                    if index < len(self.diseases) and self.diseases[index] == name:
+                        del self.diseases[index]
+                    values_changed = True
+        return values_changed
+
     def log_event(self, message):
-        self.console_text.config(state="normal")
-        self.console_text.insert(tk.END, message + "\n")
-        self.console_text.see(tk.END)
-        self.console_text.config(state="disabled")
+        append_console_line(self.console_text, message)
 
 # ---------------- DeepLearnTab ---------------- #
 class DeepLearnTab:
     def __init__(self, parent):
+        self.tab_key = "deep"
         self.frame = tk.Frame(parent)
         self.error_notified = False
         search_frame = tk.Frame(self.frame)
@@ -480,6 +1508,7 @@ class DeepLearnTab:
         self.language_combo['values'] = LANGUAGE_LIST
         self.language_combo.set("English")
         self.language_combo.pack(side=tk.LEFT, padx=5)
+        self.language_combo.bind("<<ComboboxSelected>>", self.on_language_changed)
         main_frame = tk.Frame(self.frame)
         main_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         main_frame.columnconfigure(0, weight=1)
@@ -510,14 +1539,17 @@ class DeepLearnTab:
         console_frame.pack(side=tk.BOTTOM, fill=tk.X)
         self.console_text = tk.Text(console_frame, height=5, state="disabled", font=("Helvetica", 10))
         self.console_text.pack(fill=tk.X)
+        self.result_snippets = []  # Source-language snippets behind detail_text.
+        self.view_query = ""
+        self.image_urls = []
         self.deep_details_base_url = "https://html.duckduckgo.com/html/?q="
         self.deep_images_base_url = "https://www.google.com/search?tbm=isch&q="
+        state = SESSION.view_state("deep")
+        if state:
+            self.restore_view_state(state)
 
     def log_event(self, message):
-        self.console_text.config(state="normal")
-        self.console_text.insert(tk.END, message + "\n")
-        self.console_text.see(tk.END)
-        self.console_text.config(state="disabled")
+        append_console_line(self.console_text, message)
 
     def fetch_html_deep(self, url, headers):
         proxies = {
@@ -543,11 +1575,12 @@ class DeepLearnTab:
         if not query:
             return
         self.detail_text.delete("1.0", tk.END)
-        for widget in self.image_frame.winfo_children():
-            widget.destroy()
+        self.result_snippets = []
+        self.view_query = query
+        self.clear_images()
         self.log_event(f"Deep search initiated for: {query}")
-        threading.Thread(target=self.fetch_deep_web_details, args=(query,), daemon=True).start()
-        threading.Thread(target=self.fetch_deep_images, args=(query,), daemon=True).start()
+        SCHEDULER.submit(self.tab_key, "text", self.fetch_deep_web_details, query)
+        SCHEDULER.submit(self.tab_key, "images", self.fetch_deep_images, query)
 
     def fetch_deep_web_details(self, query):
         query_str = query + " uses"
@@ -555,42 +1588,34 @@ class DeepLearnTab:
         url = self.deep_details_base_url + query_encoded
         headers = {"User-Agent": "Mozilla/5.0"}
         self.log_event(f"Deep fetching details: {query_str}")
-        html = self.fetch_html_deep(url, headers)
-        snippets = []
-        if html:
-            soup = BeautifulSoup(html, "html.parser")
-            for result in soup.find_all("div", class_="result"):
-                snippet = result.find("a", class_="result__snippet") or result.find("div", class_="result__snippet")
-                if snippet:
-                    text = snippet.get_text().strip()
-                    if text and len(text.split()) > 5:
-                        snippets.append(text)
-                if len(snippets) >= 5:
-                    break
+        snippets = SNIPPET_CACHE.get(url)
+        if snippets is None:
+            html = self.fetch_html_deep(url, headers)
+            snippets = OFFLOAD.run("snippets", extract_snippets, html) if html else []
+            if snippets:
+                SNIPPET_CACHE.put(url, snippets)
         if snippets:
             selected_language = self.language_combo.get() if self.language_combo.get() else "English"
-            lang_code = LANGUAGES.get(selected_language, "en")
-            if lang_code != "en":
-                translated_snippets = []
-                for s in snippets:
-                    try:
-                        translation = GoogleTranslator(source='auto', target=lang_code).translate(s)
-                        translated_snippets.append(translation)
-                    except Exception as e:
-                        self.log_event("Translation error: " + str(e))
-                        translated_snippets.append(s)
-                final_snippets = translated_snippets
-                header = f"\n\nWeb Details (DuckDuckGo) in {selected_language}:\n"
-            else:
-                final_snippets = snippets
-                header = "\n\nWeb Details (DuckDuckGo):\n"
+            header, final_snippets = translate_snippets(snippets, selected_language, self.log_event)
             formatted = "\n\n".join(self.format_text(s) for s in final_snippets)
-            self.detail_text.insert(tk.END, header + formatted)
+            self.detail_text.after(0, lambda: self.show_details(query, snippets, selected_language,
+                                                                 header + formatted))
             self.log_event("Web details fetched and translated successfully.")
+            prefetch_translations(snippets, selected_language)
         else:
-            self.detail_text.insert(tk.END, "\nNo additional web details found.")
+            self.detail_text.after(0, lambda: self.show_details(query, [], None,
+                                                                 "\nNo additional web details found."))
             self.log_event("No web details found.")
 
+    def show_details(self, query, snippets, language, text):
+        if query != self.view_query:
+            return
+        self.result_snippets = snippets
+        self.detail_text.insert(tk.END, text)
+        if snippets and language != (self.language_combo.get() or "English"):
+            # The language changed while these were being translated.
+            self.rerender_details()
+
     def fetch_deep_images(self, query):
         query_encoded = urllib.parse.quote(query)
         url = self.deep_images_base_url + query_encoded
@@ -600,36 +1625,82 @@ class DeepLearnTab:
         if not html:
             self.log_event("Error fetching images.")
             return
-        soup = BeautifulSoup(html, "html.parser")
-        img_urls = []
-        max_images = 20
-        for tag in soup.find_all("img"):
-            img_url = tag.get("data-src") or tag.get("src")
-            if img_url and img_url.startswith("http") and img_url not in img_urls:
-                img_urls.append(img_url)
-            if len(img_urls) >= max_images:
-                break
+        img_urls = OFFLOAD.run("images", extract_image_urls, html, 40)
+        self.image_frame.after(0, self.clear_images)
+        thumbs = iter_distinct_thumbnails(img_urls, headers, (175, 175), 20, self.log_event)
+        for index, (img_url, thumb) in enumerate(thumbs):
+            self.image_frame.after(0, lambda i=index, u=img_url, t=thumb: self.add_image(i, u, t, query))
+
+    def clear_images(self):
         for widget in self.image_frame.winfo_children():
             widget.destroy()
-        photos = []
+        self.image_frame.photos = []
+        self.image_urls = []
+
+    def add_image(self, index, img_url, thumb, query):
         columns = 4
-        for index, img_url in enumerate(img_urls):
-            try:
-                img_resp = requests.get(img_url, headers=headers, timeout=10)
-                image = Image.open(io.BytesIO(img_resp.content))
-                image = image.resize((175, 175))
-                photo = ImageTk.PhotoImage(image)
-                photos.append(photo)
-                container = tk.Frame(self.image_frame, bd=1, relief=tk.RAISED)
-                container.grid(row=index // columns, column=index % columns, padx=5, pady=5)
-                img_label = tk.Label(container, image=photo, cursor="hand2")
-                img_label.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
-                caption = tk.Label(container, text=query, font=("Helvetica", 12))
-                caption.pack(side=tk.BOTTOM, fill=tk.X)
-                img_label.bind("<Button-1>", lambda e, url=img_url: self.on_image_click(url))
-            except Exception as e:
-                self.log_event("Image error: " + str(e))
-        self.image_frame.photos = photos
+        photo = thumbnail_to_photo(thumb)
+        self.image_frame.photos.append(photo)
+        self.image_urls.append(img_url)
+        container = tk.Frame(self.image_frame, bd=1, relief=tk.RAISED)
+        container.grid(row=index // columns, column=index % columns, padx=5, pady=5)
+        img_label = tk.Label(container, image=photo, cursor="hand2")
+        img_label.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+        caption = tk.Label(container, text=query, font=("Helvetica", 12))
+        caption.pack(side=tk.BOTTOM, fill=tk.X)
+        img_label.bind("<Button-1>", lambda e, url=img_url: self.on_image_click(url))
+
+    def on_language_changed(self, event):
+        language = self.language_combo.get() or "English"
+        remember_language(language)
+        if self.result_snippets:
+            self.log_event(f"Re-translating displayed details into {language}.")
+            self.rerender_details()
+
+    def rerender_details(self):
+        # Redraw straight away when every translation is cached, otherwise translate on a worker.
+        language = self.language_combo.get() or "English"
+        snippets = list(self.result_snippets)
+        cached = cached_snippet_translations(snippets, language)
+        if cached is None:
+            SCHEDULER.submit(self.tab_key, "text", self.retranslate_details, snippets, language)
+        else:
+            header, final_snippets = cached
+            formatted = header + "\n\n".join(self.format_text(s) for s in final_snippets)
+            self.redraw_details(snippets, language, formatted)
+
+    def retranslate_details(self, snippets, language):
+        header, final_snippets = translate_snippets(snippets, language, self.log_event)
+        formatted = header + "\n\n".join(self.format_text(s) for s in final_snippets)
+        self.detail_text.after(0, lambda: self.redraw_details(snippets, language, formatted))
+
+    def redraw_details(self, snippets, language, formatted):
+        if snippets != self.result_snippets or language != (self.language_combo.get() or "English"):
+            return
+        self.detail_text.delete("1.0", tk.END)
+        self.detail_text.insert(tk.END, formatted)
+
+    def get_view_state(self):
+        return {
+            "query": self.view_query,
+            "language": self.language_combo.get(),
+            "snippets": list(self.result_snippets),
+            "images": list(self.image_urls),
+            "image_size": (175, 175),
+        }
+
+    def restore_view_state(self, state):
+        self.view_query = state.get("query") or ""
+        self.search_entry.insert(0, self.view_query)
+        self.language_combo.set(state.get("language") or "English")
+        self.result_snippets = list(state.get("snippets", []))
+        if self.result_snippets:
+            self.rerender_details()
+        self.clear_images()
+        for img_url in state.get("images", []):
+            thumb = cached_thumbnail(img_url, (175, 175))
+            if thumb is not None:
+                self.add_image(len(self.image_urls), img_url, thumb, self.view_query)
 
     def format_text(self, text):
         sentences = re.split(r'(?<=[.!?])\s+', text.strip())
@@ -642,6 +1713,7 @@ class DeepLearnTab:
 # ---------------- GeneralSearchTab ---------------- #
 class GeneralSearchTab:
     def __init__(self, parent):
+        self.tab_key = "general"
         self.frame = tk.Frame(parent)
         search_frame = tk.Frame(self.frame)
         search_frame.pack(side=tk.TOP, fill=tk.X, padx=5, pady=5)
@@ -656,6 +1728,7 @@ class GeneralSearchTab:
         self.language_combo['values'] = LANGUAGE_LIST
         self.language_combo.set("English")
         self.language_combo.pack(side=tk.LEFT, padx=5)
+        self.language_combo.bind("<<ComboboxSelected>>", self.on_language_changed)
         main_frame = tk.Frame(self.frame)
         main_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         main_frame.columnconfigure(0, weight=1)
@@ -686,12 +1759,15 @@ class GeneralSearchTab:
         console_frame.pack(side=tk.BOTTOM, fill=tk.X)
         self.console_text = tk.Text(console_frame, height=5, state="disabled", font=("Helvetica", 10))
         self.console_text.pack(fill=tk.X)
+        self.result_snippets = []  # Source-language snippets behind detail_text.
+        self.view_query = ""
+        self.image_urls = []
+        state = SESSION.view_state("general")
+        if state:
+            self.restore_view_state(state)
 
     def log_event(self, message):
-        self.console_text.config(state="normal")
-        self.console_text.insert(tk.END, message + "\n")
-        self.console_text.see(tk.END)
-        self.console_text.config(state="disabled")
+        append_console_line(self.console_text, message)
 
     def fetch_html(self, url, headers):
         try:
@@ -709,11 +1785,12 @@ class GeneralSearchTab:
         if not query:
             return
         self.detail_text.delete("1.0", tk.END)
-        for widget in self.image_frame.winfo_children():
-            widget.destroy()
+        self.result_snippets = []
+        self.view_query = query
+        self.clear_images()
         self.log_event(f"General search initiated for: {query}")
-        threading.Thread(target=self.fetch_web_details_duckduckgo, args=(query,), daemon=True).start()
-        threading.Thread(target=self.fetch_images_google, args=(query,), daemon=True).start()
+        SCHEDULER.submit(self.tab_key, "text", self.fetch_web_details_duckduckgo, query)
+        SCHEDULER.submit(self.tab_key, "images", self.fetch_images_google, query)
 
     def fetch_web_details_duckduckgo(self, query):
         query_str = query + " uses"
@@ -721,42 +1798,34 @@ class GeneralSearchTab:
         url = "https://html.duckduckgo.com/html/?q=" + query_encoded
         headers = {"User-Agent": "Mozilla/5.0"}
         self.log_event(f"Fetching details from DuckDuckGo: {query_str}")
-        html = self.fetch_html(url, headers)
-        snippets = []
-        if html:
-            soup = BeautifulSoup(html, "html.parser")
-            for result in soup.find_all("div", class_="result"):
-                snippet = result.find("a", class_="result__snippet") or result.find("div", class_="result__snippet")
-                if snippet:
-                    text = snippet.get_text().strip()
-                    if text and len(text.split()) > 5:
-                        snippets.append(text)
-                if len(snippets) >= 5:
-                    break
+        snippets = SNIPPET_CACHE.get(url)
+        if snippets is None:
+            html = self.fetch_html(url, headers)
+            snippets = OFFLOAD.run("snippets", extract_snippets, html) if html else []
+            if snippets:
+                SNIPPET_CACHE.put(url, snippets)
         if snippets:
             selected_language = self.language_combo.get() if self.language_combo.get() else "English"
-            lang_code = LANGUAGES.get(selected_language, "en")
-            if lang_code != "en":
-                translated_snippets = []
-                for s in snippets:
-                    try:
-                        translation = GoogleTranslator(source='auto', target=lang_code).translate(s)
-                        translated_snippets.append(translation)
-                    except Exception as e:
-                        self.log_event("Translation error: " + str(e))
-                        translated_snippets.append(s)
-                final_snippets = translated_snippets
-                header = f"\n\nWeb Details (DuckDuckGo) in {selected_language}:\n"
-            else:
-                final_snippets = snippets
-                header = "\n\nWeb Details (DuckDuckGo):\n"
+            header, final_snippets = translate_snippets(snippets, selected_language, self.log_event)
             formatted = "\n\n".join(self.format_text(s) for s in final_snippets)
-            self.detail_text.insert(tk.END, header + formatted)
+            self.detail_text.after(0, lambda: self.show_details(query, snippets, selected_language,
+                                                                 header + formatted))
             self.log_event("Web details fetched and translated successfully.")
+            prefetch_translations(snippets, selected_language)
         else:
-            self.detail_text.insert(tk.END, "\nNo additional web details found.")
+            self.detail_text.after(0, lambda: self.show_details(query, [], None,
+                                                                 "\nNo additional web details found."))
             self.log_event("No web details found.")
 
+    def show_details(self, query, snippets, language, text):
+        if query != self.view_query:
+            return
+        self.result_snippets = snippets
+        self.detail_text.insert(tk.END, text)
+        if snippets and language != (self.language_combo.get() or "English"):
+            # The language changed while these were being translated.
+            self.rerender_details()
+
     def fetch_images_google(self, query):
         query_encoded = urllib.parse.quote(query)
         url = "https://www.google.com/search?tbm=isch&q=" + query_encoded
@@ -766,36 +1835,82 @@ class GeneralSearchTab:
         if not html:
             self.log_event("Error fetching images.")
             return
-        soup = BeautifulSoup(html, "html.parser")
-        img_urls = []
-        max_images = 20
-        for tag in soup.find_all("img"):
-            img_url = tag.get("data-src") or tag.get("src")
-            if img_url and img_url.startswith("http") and img_url not in img_urls:
-                img_urls.append(img_url)
-            if len(img_urls) >= max_images:
-                break
+        img_urls = OFFLOAD.run("images", extract_image_urls, html, 40)
+        self.image_frame.after(0, self.clear_images)
+        thumbs = iter_distinct_thumbnails(img_urls, headers, (175, 175), 20, self.log_event)
+        for index, (img_url, thumb) in enumerate(thumbs):
+            self.image_frame.after(0, lambda i=index, u=img_url, t=thumb: self.add_image(i, u, t, query))
+
+    def clear_images(self):
         for widget in self.image_frame.winfo_children():
             widget.destroy()
-        photos = []
+        self.image_frame.photos = []
+        self.image_urls = []
+
+    def add_image(self, index, img_url, thumb, query):
         columns = 4
-        for index, img_url in enumerate(img_urls):
-            try:
-                img_resp = requests.get(img_url, headers=headers, timeout=10)
-                image = Image.open(io.BytesIO(img_resp.content))
-                image = image.resize((175, 175))
-                photo = ImageTk.PhotoImage(image)
-                photos.append(photo)
-                container = tk.Frame(self.image_frame, bd=1, relief=tk.RAISED)
-                container.grid(row=index // columns, column=index % columns, padx=5, pady=5)
-                img_label = tk.Label(container, image=photo, cursor="hand2")
-                img_label.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
-                caption = tk.Label(container, text=query, font=("Helvetica", 12))
-                caption.pack(side=tk.BOTTOM, fill=tk.X)
-                img_label.bind("<Button-1>", lambda e, url=img_url: self.on_image_click(url))
-            except Exception as e:
-                self.log_event("Image error: " + str(e))
-        self.image_frame.photos = photos
+        photo = thumbnail_to_photo(thumb)
+        self.image_frame.photos.append(photo)
+        self.image_urls.append(img_url)
+        container = tk.Frame(self.image_frame, bd=1, relief=tk.RAISED)
+        container.grid(row=index // columns, column=index % columns, padx=5, pady=5)
+        img_label = tk.Label(container, image=photo, cursor="hand2")
+        img_label.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+        caption = tk.Label(container, text=query, font=("Helvetica", 12))
+        caption.pack(side=tk.BOTTOM, fill=tk.X)
+        img_label.bind("<Button-1>", lambda e, url=img_url: self.on_image_click(url))
+
+    def on_language_changed(self, event):
+        language = self.language_combo.get() or "English"
+        remember_language(language)
+        if self.result_snippets:
+            self.log_event(f"Re-translating displayed details into {language}.")
+            self.rerender_details()
+
+    def rerender_details(self):
+        # Redraw straight away when every translation is cached, otherwise translate on a worker.
+        language = self.language_combo.get() or "English"
+        snippets = list(self.result_snippets)
+        cached = cached_snippet_translations(snippets, language)
+        if cached is None:
+            SCHEDULER.submit(self.tab_key, "text", self.retranslate_details, snippets, language)
+        else:
+            header, final_snippets = cached
+            formatted = header + "\n\n".join(self.format_text(s) for s in final_snippets)
+            self.redraw_details(snippets, language, formatted)
+
+    def retranslate_details(self, snippets, language):
+        header, final_snippets = translate_snippets(snippets, language, self.log_event)
+        formatted = header + "\n\n".join(self.format_text(s) for s in final_snippets)
+        self.detail_text.after(0, lambda: self.redraw_details(snippets, language, formatted))
+
+    def redraw_details(self, snippets, language, formatted):
+        if snippets != self.result_snippets or language != (self.language_combo.get() or "English"):
+            return
+        self.detail_text.delete("1.0", tk.END)
+        self.detail_text.insert(tk.END, formatted)
+
+    def get_view_state(self):
+        return {
+            "query": self.view_query,
+            "language": self.language_combo.get(),
+            "snippets": list(self.result_snippets),
+            "images": list(self.image_urls),
+            "image_size": (175, 175),
+        }
+
+    def restore_view_state(self, state):
+        self.view_query = state.get("query") or ""
+        self.search_entry.insert(0, self.view_query)
+        self.language_combo.set(state.get("language") or "English")
+        self.result_snippets = list(state.get("snippets", []))
+        if self.result_snippets:
+            self.rerender_details()
+        self.clear_images()
+        for img_url in state.get("images", []):
+            thumb = cached_thumbnail(img_url, (175, 175))
+            if thumb is not None:
+                self.add_image(len(self.image_urls), img_url, thumb, self.view_query)
 
     def format_text(self, text):
         sentences = re.split(r'(?<=[.!?])\s+', text.strip())
@@ -807,12 +1922,15 @@ class GeneralSearchTab:
 
 # ---------------- Main Execution ---------------- #
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     if not is_tor_running():
         print("Tor is not running. Attempting to start Tor daemon...")
         if start_tor_daemon():
             print("Tor daemon started.")
         else:
             print("Could not start Tor daemon. Deep search functionality may not work.")
+    OFFLOAD.warm()
     root = tk.Tk()
     app = MainApp(root)
     root.mainloop()
+    OFFLOAD.shutdown()
@@ -0,0 +1,174 @@
+"""
+Long-session soak benchmark for herbal_treatment.py.
+
+Builds the real MainApp, replaces the network (Google suggestions, DuckDuckGo,
+Google Images, image downloads) and the translator with local stand-ins, then
+drives thousands of keystrokes and searches through the tabs. Every
+--report-every steps it prints the process RSS and Tk object counts so growth
+over a long session is easy to spot.
+
+Usage:
+    python soak_benchmark.py --steps 5000 --report-every 250 --cpu-mode thread
+"""
+import argparse
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+import tkinter as tk
+import urllib.parse
+from tkinter import messagebox
+
+from PIL import Image
+
+import herbal_treatment as app
+
+WORDS = ["ginger", "garlic", "turmeric", "peppermint", "chamomile", "aloe vera", "echinacea",
+         "ginseng", "lavender", "licorice", "sage", "thyme", "neem", "ashwagandha", "valerian"]
+
+# ---------------- Local Stand-ins ---------------- #
+class FakeResponse:
+    def __init__(self, text="", content=b"", data=None):
+        self.status_code = 200
+        self.text = text
+        self.content = content
+        self.data = data
+
+    def json(self):
+        return self.data
+
+def make_png(seed):
+    # A per-seed random 9x8 block pattern: a solid colour would give every image dHash 0 and the
+    # grids would collapse to a single near-duplicate thumbnail.
+    rng = random.Random(seed)
+    blocks = Image.new("L", (9, 8))
+    blocks.putdata([rng.randrange(256) for _ in range(9 * 8)])
+    tint = Image.new("RGB", (9, 8), ((seed * 37) % 256, (seed * 91) % 256, (seed * 53) % 256))
+    image = Image.blend(blocks.convert("RGB"), tint, 0.3).resize((320, 240), Image.NEAREST)
+    buffer = io.BytesIO()
+    image.save(buffer, "PNG")
+    return buffer.getvalue()
+
+PNGS = [make_png(seed) for seed in range(32)]  # Enough distinct images to fill a 20-slot grid.
+
+def fake_get(url, headers=None, timeout=None, proxies=None, **kwargs):
+    parsed = urllib.parse.urlparse(url)
+    query = urllib.parse.parse_qs(parsed.query).get("q", [""])[0]
+    if "suggestqueries" in parsed.netloc:
+        return FakeResponse(data=[query, [f"{query} {word}" for word in WORDS[:8]]])
+    if "duckduckgo" in parsed.netloc:
+        results = "".join(
+            f'<div class="result"><a class="result__snippet">{query} snippet {i} describes '
+            f'traditional preparation and common uses in detail.</a></div>' for i in range(8))
+        return FakeResponse(text=f"<html><body>{results}</body></html>")
+    if "tbm=isch" in url:
+        tags = "".join(f'<img src="http://img.local/{urllib.parse.quote(query)}/{i}.png">' for i in range(30))
+        return FakeResponse(text=f"<html><body>{tags}</body></html>")
+    return FakeResponse(content=PNGS[hash(url) % len(PNGS)])
+
+class FakeTranslator:
+    def __init__(self, source="auto", target="en"):
+        self.target = target
+
+    def translate(self, text):
+        return f"[{self.target}] {text}"
+
+def install_stand_ins(snapshot_dir):
+    app.requests.get = fake_get
+    app.GoogleTranslator = FakeTranslator
+    app.SESSION = app.SessionStore(os.path.join(snapshot_dir, "session_snapshot.bin"))
+    messagebox.showinfo = lambda *args, **kwargs: None
+    messagebox.showerror = lambda *args, **kwargs: None
+
+# ---------------- Measurements ---------------- #
+def current_rss_kb():
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss // 1024
+    except ImportError:
+        pass
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except OSError:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss  # Peak, not current.
+
+def count_widgets(widget):
+    return 1 + sum(count_widgets(child) for child in widget.winfo_children())
+
+def console_lines(tab):
+    return int(tab.console_text.index("end-1c").split(".")[0]) - 1
+
+def settle(root, timeout=5.0):
+    # Pump the Tk loop until the fetch scheduler has drained the work queued by the last step.
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        root.update()
+        if app.SCHEDULER.is_idle():
+            break
+        time.sleep(0.005)
+    root.update()
+
+# ---------------- Driver ---------------- #
+class KeyEvent:
+    def __init__(self, keysym):
+        self.keysym = keysym
+
+def type_query(entry, text):
+    entry.delete(0, tk.END)
+    for char in text:
+        entry.insert(tk.END, char)
+        entry.on_keyrelease(KeyEvent(char))
+    entry.hide_suggestions()
+
+def run(steps, report_every, cpu_mode):
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    snapshot_dir = tempfile.mkdtemp(prefix="herbal-soak-")
+    install_stand_ins(snapshot_dir)
+    app.OFFLOAD.set_mode(cpu_mode)
+    root = tk.Tk()
+    main = app.MainApp(root)
+    tabs = [main.herb_tab, main.deep_learn_tab, main.general_tab]
+    settle(root)
+    keystrokes = 0
+    start = time.perf_counter()
+    print(f"{'step':>6} {'secs':>7} {'rss_mb':>8} {'widgets':>8} {'images':>7} {'keys':>7} {'console':>8}")
+
+    def report(step):
+        print(f"{step:>6} {time.perf_counter() - start:7.1f} {current_rss_kb() / 1024:8.1f} "
+              f"{count_widgets(root):>8} {len(root.image_names()):>7} {keystrokes:>7} "
+              f"{max(console_lines(tab) for tab in tabs):>8}", flush=True)
+
+    report(0)
+    for step in range(1, steps + 1):
+        tab = tabs[step % len(tabs)]
+        query = f"{WORDS[step % len(WORDS)]} {step % 97}"
+        type_query(tab.search_entry, query)
+        keystrokes += len(query)
+        if tab is main.herb_tab and step % 2:
+            tab.disease_combo.current(step % len(tab.diseases))
+            tab.on_disease_selected(None)
+        else:
+            tab.on_search()
+        if step % 10 == 0:
+            tab.language_combo.set(app.LANGUAGE_LIST[step % len(app.LANGUAGE_LIST)])
+            tab.on_language_changed(None)
+        settle(root)
+        if step % report_every == 0:
+            report(step)
+    print()
+    print(app.SCHEDULER.summary())
+    main.herb_tab.csv_watcher.stop()
+    root.destroy()
+    app.OFFLOAD.shutdown()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Soak-test memory and Tk object growth over a long session.")
+    parser.add_argument("--steps", type=int, default=3000, help="number of searches to drive")
+    parser.add_argument("--report-every", type=int, default=250, help="print a sample every N searches")
+    parser.add_argument("--cpu-mode", choices=app.CpuOffload.MODES, default="thread")
+    args = parser.parse_args()
+    sys.exit(run(args.steps, args.report_every, args.cpu_mode))
@@ -0,0 +1,40 @@
+import pytest
+
+from herbal_treatment import CpuOffload, extract_image_urls
+
+HTML = '<html><body><img src="http://a/1.png"><img src="http://a/2.png"></body></html>'
+
+def fail(message):
+    raise RuntimeError(message)
+
+@pytest.fixture
+def offload():
+    offload = CpuOffload("thread", workers=1)
+    yield offload
+    offload.shutdown()
+
+def test_thread_mode_runs_inline(offload):
+    assert offload.run("images", extract_image_urls, HTML, 5) == ["http://a/1.png", "http://a/2.png"]
+    assert offload.pool is None
+    assert list(offload.timings) == [("thread", "images")]
+
+def test_process_mode_uses_the_pool(offload):
+    offload.set_mode("process")
+    assert offload.run("images", extract_image_urls, HTML, 1) == ["http://a/1.png"]
+    assert offload.pool is not None
+    assert list(offload.timings) == [("process", "images")]
+
+def test_errors_from_the_job_propagate_without_a_retry(offload):
+    offload.set_mode("process")
+    with pytest.raises(RuntimeError, match="bad page"):
+        offload.run("snippets", fail, "bad page")
+    assert offload.pool is not None
+    assert offload.timings == {}
+
+def test_falls_back_inline_after_shutdown(offload):
+    offload.set_mode("process")
+    offload.run("images", extract_image_urls, HTML, 1)
+    offload.shutdown()
+    assert offload.run("images", extract_image_urls, HTML, 1) == ["http://a/1.png"]
+    assert offload.pool is None
+    assert ("thread", "images") in offload.timings
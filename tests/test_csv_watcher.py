@@ -0,0 +1,51 @@
+from herbal_treatment import CsvWatcher
+
+HEADER = "Disease/Illness,Herb,Parts Used"
+
+def write_csv(path, lines):
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+def diseases(rows):
+    return sorted(row["Disease/Illness"] for row in rows)
+
+def test_first_scan_adds_every_row(tmp_path):
+    path = tmp_path / "herbal.csv"
+    write_csv(path, [HEADER, "Cough,Ginger,Root", "Fever,Neem,Leaf"])
+    added, removed = CsvWatcher(str(path), None).scan()
+    assert diseases(added) == ["Cough", "Fever"]
+    assert added[0]["Herb"] == "Ginger"
+    assert removed == []
+
+def test_row_added_and_removed(tmp_path):
+    path = tmp_path / "herbal.csv"
+    write_csv(path, [HEADER, "Cough,Ginger,Root", "Fever,Neem,Leaf"])
+    watcher = CsvWatcher(str(path), None)
+    watcher.scan()
+    write_csv(path, [HEADER, "Fever,Neem,Leaf", "Insomnia,Valerian,Root"])
+    added, removed = watcher.scan()
+    assert diseases(added) == ["Insomnia"]
+    assert diseases(removed) == ["Cough"]
+
+def test_duplicate_lines_are_counted(tmp_path):
+    path = tmp_path / "herbal.csv"
+    write_csv(path, [HEADER, "Cough,Ginger,Root"])
+    watcher = CsvWatcher(str(path), None)
+    watcher.scan()
+    write_csv(path, [HEADER, "Cough,Ginger,Root", "Cough,Ginger,Root", "Cough,Ginger,Root"])
+    added, removed = watcher.scan()
+    assert diseases(added) == ["Cough", "Cough"]
+    assert removed == []
+    write_csv(path, [HEADER, "Cough,Ginger,Root"])
+    added, removed = watcher.scan()
+    assert added == []
+    assert diseases(removed) == ["Cough", "Cough"]
+
+def test_header_change_reparses_everything(tmp_path):
+    path = tmp_path / "herbal.csv"
+    write_csv(path, [HEADER, "Cough,Ginger,Root"])
+    watcher = CsvWatcher(str(path), None)
+    watcher.scan()
+    write_csv(path, ["Disease/Illness\tHerb\tParts Used", "Cough\tGinger\tRoot"])
+    added, removed = watcher.scan()
+    assert diseases(removed) == ["Cough"]
+    assert [(row["Disease/Illness"], row["Herb"]) for row in added] == [("Cough", "Ginger")]
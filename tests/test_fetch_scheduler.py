@@ -0,0 +1,41 @@
+import threading
+
+from herbal_treatment import FetchScheduler
+
+def run_queued(scheduler, submissions, before_release=None):
+    # One worker is held on a gate task so everything else queues up, then released.
+    gate = threading.Event()
+    done = threading.Event()
+    order = []
+    scheduler.submit("herb", "text", gate.wait)
+    for tab_key, kind, name in submissions:
+        scheduler.submit(tab_key, kind, order.append, name)
+    if before_release:
+        before_release()
+    scheduler.submit(None, "prefetch", lambda: done.set())
+    gate.set()
+    assert done.wait(5)
+    return order
+
+def test_runs_in_priority_order():
+    scheduler = FetchScheduler(max_workers=1, foreground="herb")
+    order = run_queued(scheduler, [
+        (None, "prefetch", "prefetch"),
+        ("deep", "text", "background"),
+        ("herb", "images", "images"),
+        ("herb", "text", "text"),
+    ])
+    assert order == ["text", "images", "background", "prefetch"]
+
+def test_same_priority_keeps_submission_order():
+    scheduler = FetchScheduler(max_workers=1, foreground="herb")
+    order = run_queued(scheduler, [("herb", "text", "first"), ("herb", "text", "second")])
+    assert order == ["first", "second"]
+
+def test_foreground_change_reranks_queued_tasks():
+    scheduler = FetchScheduler(max_workers=1, foreground="herb")
+    order = run_queued(scheduler, [
+        ("herb", "text", "herb"),
+        ("general", "text", "general"),
+    ], before_release=lambda: scheduler.set_foreground("general"))
+    assert order == ["general", "herb"]
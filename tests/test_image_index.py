@@ -0,0 +1,32 @@
+from herbal_treatment import ImageIndex
+
+def flip_bits(value, count):
+    for bit in range(count):
+        value ^= 1 << (bit * 9)
+    return value
+
+def test_near_duplicate_collapses_to_first_hash():
+    index = ImageIndex()
+    base = 0x0123456789ABCDEF
+    assert index.add("http://a/1.jpg", base) == base
+    assert index.add("http://b/1.jpg", flip_bits(base, 3)) == base
+    assert index.hash_for_url("http://b/1.jpg") == base
+
+def test_distinct_image_keeps_its_own_hash():
+    index = ImageIndex()
+    base = 0x0123456789ABCDEF
+    index.add("http://a/1.jpg", base)
+    other = base ^ 0xFFFFFFFFFFFFFFFF
+    assert index.add("http://c/1.jpg", other) == other
+
+def test_oldest_urls_are_evicted_past_the_cap():
+    index = ImageIndex(max_urls=2)
+    base = 0x0123456789ABCDEF
+    index.add("http://a/1.jpg", base)
+    index.add("http://a/2.jpg", base ^ 0xFFFFFFFF00000000)
+    index.add("http://a/3.jpg", base ^ 0x00000000FFFFFFFF)
+    assert [url for url, _ in index.items()] == ["http://a/2.jpg", "http://a/3.jpg"]
+    assert index.hash_for_url("http://a/1.jpg") is None
+    # Once nothing points at it, the evicted hash no longer absorbs new near-duplicates.
+    assert base not in index.hash_refs
+    assert index.add("http://b/1.jpg", flip_bits(base, 2)) == flip_bits(base, 2)
@@ -0,0 +1,46 @@
+import json
+import zlib
+
+import pytest
+
+import herbal_treatment as app
+from herbal_treatment import SNAPSHOT_VERSION, SessionStore
+
+def write_snapshot(path, snapshot):
+    path.write_bytes(zlib.compress(json.dumps(snapshot).encode("utf-8")))
+
+def test_save_and_load_round_trip(tmp_path):
+    app.TRANSLATION_CACHE.put(("fr", "hello"), "bonjour")
+    path = tmp_path / "session_snapshot.bin"
+    SessionStore(str(path)).save({"herb": {"disease": "Cough", "images": [], "image_size": (200, 200)}})
+    app.TRANSLATION_CACHE.entries.clear()
+    store = SessionStore(str(path))
+    assert store.view_state("herb")["disease"] == "Cough"
+    assert store.view_state("deep") is None
+    assert not store.is_stale()
+    assert app.TRANSLATION_CACHE.get(("fr", "hello")) == "bonjour"
+
+def test_missing_file_loads_as_none(tmp_path):
+    store = SessionStore(str(tmp_path / "missing.bin"))
+    assert store.view_state("herb") is None
+    assert store.is_stale()
+
+@pytest.mark.parametrize("snapshot", [
+    [],
+    {"version": SNAPSHOT_VERSION - 1, "saved_at": 0, "views": {}, "caches": {}},
+    {"version": SNAPSHOT_VERSION, "saved_at": 0, "caches": {}},
+    {"version": SNAPSHOT_VERSION, "saved_at": 0, "views": [], "caches": {}},
+    {"version": SNAPSHOT_VERSION, "saved_at": 0, "views": {"herb": []}, "caches": {}},
+    {"version": SNAPSHOT_VERSION, "saved_at": 0, "views": {}, "caches": []},
+    {"version": SNAPSHOT_VERSION, "saved_at": "yesterday", "views": {}, "caches": {}},
+    {"version": SNAPSHOT_VERSION, "saved_at": 0, "views": {}, "caches": {"translations": [1]}},
+])
+def test_malformed_snapshot_is_ignored(tmp_path, snapshot):
+    path = tmp_path / "session_snapshot.bin"
+    write_snapshot(path, snapshot)
+    assert SessionStore(str(path)).view_state("herb") is None
+
+def test_corrupt_file_is_ignored(tmp_path):
+    path = tmp_path / "session_snapshot.bin"
+    path.write_bytes(b"not a snapshot")
+    assert SessionStore(str(path)).view_state("herb") is None